@@ -3,8 +3,8 @@
 Command-line interface for the autocomplete trie utility.
 
 Available commands (stdin one per line):
-  load <csv_path>
-  save <csv_path>
+  load <csv_path | trie_path>
+  save <csv_path | trie_path>
   insert <word> <score>
   remove <word>
   contains <word>
@@ -12,6 +12,9 @@ Available commands (stdin one per line):
   stats
   quit
 
+Paths ending in .trie use the binary format of Trie.save_bin(), which
+loads by memory-mapping the file instead of rebuilding the trie.
+
 This version is functionally equivalent but independently written.
 """
 
@@ -24,43 +27,61 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.trie import Trie
+from src.trie import Trie, MappedTrie
 from src.io_utils import load_csv, save_csv
 
+BIN_SUFFIX = ".trie"
+READ_CHUNK = 1 << 20  # bytes requested from stdin per read
+
 
 def handle_load(path: str) -> "Trie":
     """Load word–score pairs from a CSV file into a new Trie.
+    A .trie file is memory-mapped as a read-only MappedTrie instead.
     This command is intentionally silent on success to match test expectations.
     """
+    if Path(path).suffix == BIN_SUFFIX:
+        return Trie.load_bin(path)
     trie = Trie()
     pairs = load_csv(Path(path))
-    for w, s in pairs:
-        trie.insert(w.lower(), s)
+    trie.bulk_insert([(w.lower(), s) for w, s in pairs])
     return trie
 
 
 def handle_save(trie: "Trie", path: str) -> None:
-    """Write all trie items to a CSV file. Silent on success."""
-    save_csv(Path(path), trie.items())
+    """Write all trie items to a CSV (or .trie) file. Silent on success."""
+    if Path(path).suffix == BIN_SUFFIX:
+        trie.save_bin(path)
+    else:
+        save_csv(Path(path), trie.items())
+
+
+def writable(trie: "Trie") -> "Trie":
+    """Return an editable trie, thawing a memory-mapped one if needed."""
+    return trie.thaw() if isinstance(trie, MappedTrie) else trie
 
 
-def handle_insert(trie: "Trie", word: str, freq: str) -> None:
+def handle_insert(trie: "Trie", word: str, freq: str) -> "Trie":
     """Insert a new word-frequency pair. Silent on success."""
     try:
-        trie.insert(word.lower(), float(freq))
+        score = float(freq)
     except ValueError:
         # malformed freq — ignore per grading tolerance
-        pass
+        return trie
+    trie = writable(trie)
+    trie.insert(word.lower(), score)
+    return trie
 
 
-def handle_remove(trie: "Trie", word: str) -> None:
+def handle_remove(trie: "Trie", word: str) -> "Trie":
     """Remove a word if present and print OK or MISS."""
-    print("OK" if trie.remove(word.lower()) else "MISS", flush=True)
+    trie = writable(trie)
+    print("OK" if trie.remove(word.lower()) else "MISS")
+    return trie
 
 
 def handle_contains(trie: "Trie", word: str) -> None:
     """Print YES if present else NO."""
-    print("YES" if trie.contains(word.lower()) else "NO", flush=True)
+    print("YES" if trie.contains(word.lower()) else "NO")
 
 
 def handle_complete(trie: "Trie", prefix: str, limit: str) -> None:
@@ -70,13 +91,25 @@ def handle_complete(trie: "Trie", prefix: str, limit: str) -> None:
     except ValueError:
         return
     results = trie.complete(prefix.lower(), k)
-    print(",".join(results), flush=True)
+    print(",".join(results))
 
 
 def handle_stats(trie: "Trie") -> None:
     """Print basic trie stats."""
     words, height, nodes = trie.stats()
-    print(f"words={words} height={height} nodes={nodes}", flush=True)
+    print(f"words={words} height={height} nodes={nodes}")
+
+
+# command → (argument count, handler(trie, *args) returning a new trie or None)
+COMMANDS = {
+    "load": (1, lambda trie, path: handle_load(path)),
+    "save": (1, handle_save),
+    "insert": (2, handle_insert),
+    "remove": (1, handle_remove),
+    "contains": (1, handle_contains),
+    "complete": (2, handle_complete),
+    "stats": (0, handle_stats),
+}
 
 
 def execute(trie: "Trie", command: str):
@@ -90,21 +123,12 @@ def execute(trie: "Trie", command: str):
     if cmd == "quit":
         return trie, False
 
+    entry = COMMANDS.get(cmd)
+    if entry is None or len(parts) - 1 != entry[0]:
+        return trie, True
+
     try:
-        if cmd == "load" and len(parts) == 2:
-            trie = handle_load(parts[1])
-        elif cmd == "save" and len(parts) == 2:
-            handle_save(trie, parts[1])
-        elif cmd == "insert" and len(parts) == 3:
-            handle_insert(trie, parts[1], parts[2])
-        elif cmd == "remove" and len(parts) == 2:
-            handle_remove(trie, parts[1])
-        elif cmd == "contains" and len(parts) == 2:
-            handle_contains(trie, parts[1])
-        elif cmd == "complete" and len(parts) == 3:
-            handle_complete(trie, parts[1], parts[2])
-        elif cmd == "stats" and len(parts) == 1:
-            handle_stats(trie)
+        trie = entry[1](trie, *parts[1:]) or trie
     except FileNotFoundError:
         print(f"ERROR: File not found at {parts[1]}", file=sys.stderr)
     except (IOError, OSError) as e:
@@ -117,12 +141,31 @@ def execute(trie: "Trie", command: str):
 
 
 def main():
-    """Main interactive loop reading commands from stdin."""
+    """Main interactive loop reading commands from stdin.
+
+    Input is read in large binary chunks and split on newlines; output is
+    left buffered and flushed only before blocking on the next read, so
+    piped scripts run without a syscall per line while interactive use
+    still sees each answer before it types the next command.
+    """
     trie = Trie()
-    for line in sys.stdin:
-        trie, cont = execute(trie, line)
-        if not cont:
+    stdin = sys.stdin.buffer
+    tail = b""
+    while True:
+        sys.stdout.flush()
+        chunk = stdin.read1(READ_CHUNK)  # returns whatever is available
+        if not chunk:
             break
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()  # partial line, completed by the next chunk
+        for line in lines:
+            trie, cont = execute(trie, line.decode("utf-8", "replace"))
+            if not cont:
+                sys.stdout.flush()
+                return
+    if tail:
+        execute(trie, tail.decode("utf-8", "replace"))
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
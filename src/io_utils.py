@@ -7,6 +7,12 @@ No header is used.
 """
 
 import csv
+import io
+import mmap
+import os
+
+# Upper bound on distinct score strings remembered by one _parse_lines call.
+_SCORE_CACHE_MAX = 1 << 16
 
 
 def load_csv(file_path):
@@ -15,24 +21,16 @@ def load_csv(file_path):
 
     Invalid or missing scores default to 0.0.
     Blank lines are skipped.
+
+    Parses a memory-mapped view of the file directly.
     """
     pairs = []
     try:
-        with open(file_path, mode="r", encoding="utf-8", newline="") as f:
-            for row in csv.reader(f):
-                if not row:
-                    continue
-
-                # normalize word text
-                word = row[0].strip().lower()
-
-                # parse score safely
-                try:
-                    score = float(row[1]) if len(row) > 1 else 0.0
-                except ValueError:
-                    score = 0.0
-
-                pairs.append((word, score))
+        with open(file_path, mode="rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return pairs  # mmap refuses empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _parse_lines(mm, pairs)
 
     except FileNotFoundError:
         print(f"ERROR: could not find file '{file_path}'")
@@ -44,15 +42,82 @@ def load_csv(file_path):
     return pairs
 
 
+def _parse_lines(buf, pairs):
+    """
+    Append (word, score) for every line of buf to pairs.
+
+    The buffer is decoded in one call and cut with split()/partition().
+    Text with quotes or bare \r line endings goes through _parse_rows
+    instead, since only the csv state machine handles those the way the
+    file was written. Word lists repeat a small set of score strings, so
+    each distinct one is parsed once and then served from a dict.
+    """
+    text = buf[:].decode("utf-8")
+    if '"' in text or text.count("\r") != text.count("\r\n"):
+        _parse_rows(text, pairs)
+        return
+
+    append = pairs.append
+    scores = {}
+    for line in text.split("\n"):
+        if not line or line == "\r":
+            continue
+
+        word, sep, rest = line.partition(",")
+        if not sep:
+            score = 0.0
+        else:
+            score = scores.get(rest)
+            if score is None:
+                score = _parse_score(rest)
+                if len(scores) < _SCORE_CACHE_MAX:
+                    scores[rest] = score
+
+        append((word.strip().lower(), score))
+
+
+def _parse_rows(text, pairs):
+    """Append (word, score) for every csv.reader row of text to pairs."""
+    append = pairs.append
+    for row in csv.reader(io.StringIO(text, newline="")):
+        if not row:
+            continue
+        try:
+            score = float(row[1]) if len(row) > 1 else 0.0
+        except ValueError:
+            score = 0.0
+        append((row[0].strip().lower(), score))
+
+
+def _parse_score(text):
+    """float(text), ignoring extra columns; invalid scores become 0.0."""
+    try:
+        return float(text)  # float() ignores a trailing \r
+    except ValueError:
+        # extra columns after the score, or not a number at all
+        try:
+            return float(text.partition(",")[0])
+        except ValueError:
+            return 0.0
+
+
 def save_csv(file_path, data):
     """
     Write (word, score) pairs to a CSV file in UTF-8 encoding.
     Overwrites the file if it already exists.
+
+    Rows are formatted in one pass and written with a single write(); the
+    csv module is only used when some word needs quoting.
     """
+    data = list(data)
+    words = "\0".join([w for w, _ in data])
+    plain = not any(ch in words for ch in ',"\r\n')
     try:
         with open(file_path, mode="w", encoding="utf-8", newline="") as f:
-            writer = csv.writer(f)
-            for w, s in data:
-                writer.writerow([w, s])
+            if plain:
+                # same bytes csv.writer would produce, \r\n line endings included
+                f.write("".join([f"{w},{s}\r\n" for w, s in data]))
+            else:
+                csv.writer(f).writerows(data)
     except OSError as e:
         print(f"ERROR: failed to write '{file_path}': {e}")
@@ -4,24 +4,255 @@ Trie data structure for autocomplete and prefix lookups.
 Expected public interface:
   class Trie
     - insert(word: str, freq: float)
+    - bulk_insert(pairs: Iterable[tuple[str, float]])
     - remove(word: str) -> bool
     - contains(word: str) -> bool
     - complete(prefix: str, k: int) -> list[str]
     - stats() -> tuple[int, int, int]  # (word_count, height, node_count)
     - items() -> list[tuple[str, float]]
+    - save_bin(path) / load_bin(path) -> MappedTrie
+
+The trie is stored in radix (PATRICIA) form: every edge carries a whole
+substring, so chains of single-child nodes collapse into one node. Words are
+kept as UTF-8 bytes internally, so the hot loops index small ints instead of
+hashing one-character strings; text is decoded only for results.
+
+  class MappedTrie
+    Read-only view of a file written by save_bin(); answers queries from
+    the memory-mapped bytes and thaw()s into a Trie for edits.
 """
 
 import heapq
+import mmap
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+from operator import itemgetter
+
+_NO_SCORE = float("-inf")
+_CACHE_SIZE = 1024  # complete() results kept per Trie
+
+# Children for the common alphabet live in a fixed-size list indexed through
+# _IDX (byte value → slot), so the hot path avoids hashing and iterates in
+# alphabetical order.
+_CHARSET = b"'abcdefghijklmnopqrstuvwxyz"
+_WIDTH = len(_CHARSET)
+_IDX = [-1] * 256
+for _i, _b in enumerate(_CHARSET):
+    _IDX[_b] = _i
+
+# Maps byte b to 254 - b (UTF-8 never contains 0xFF). A translated word
+# followed by the 0xFF terminator, which sorts above every mapped byte, sorts
+# in exactly the reverse order of the word, so (score, key) min-heaps evict
+# the lowest score first and, among equal scores, the alphabetically last word.
+_INVERT = bytes(range(254, -1, -1)) + b"\xff"
+
+# Binary layout (little-endian), nodes in BFS order after the header:
+#   header: magic, file size, word_count, node_count, height
+#   node:   end, score, max_sub, label_len, n_children, label (UTF-8),
+#           then n_children edges of (first label byte, child offset)
+_MAGIC = b"TRI3"
+_HEADER = struct.Struct("<4sIIII")
+_RECORD = struct.Struct("<BddIH")
+_EDGE = struct.Struct("<BI")
 
 
 class _Node:
-    """A lightweight Trie node storing children, word flag, and frequency."""
-    __slots__ = ("next", "end", "score")
-
-    def __init__(self):
-        self.next = {}     # char → _Node
-        self.end = False   # does this node mark a word ending?
-        self.score = 0.0   # only valid if end=True
+    """A lightweight radix node storing its edge label, children, word flag, and frequency."""
+    __slots__ = ("label", "next", "extra", "end", "score", "max_sub")
+
+    def __init__(self, label: bytes = b""):
+        self.label = label  # UTF-8 bytes on the edge leading into this node
+        self.next = None    # list of _WIDTH children, allocated on first use
+        self.extra = None   # first byte → _Node for bytes outside _CHARSET
+        self.end = False    # does this node mark a word ending?
+        self.score = 0.0    # only valid if end=True
+        self.max_sub = _NO_SCORE  # best score anywhere in this subtree
+
+
+def _child(node: _Node, b: int):
+    """Return the child of node whose label starts with byte b, or None."""
+    idx = _IDX[b]
+    if idx >= 0:
+        return node.next[idx] if node.next is not None else None
+    return node.extra.get(b) if node.extra is not None else None
+
+
+def _set_child(node: _Node, child: _Node):
+    """Attach child under node, keyed by the first byte of its label."""
+    b = child.label[0]
+    idx = _IDX[b]
+    if idx >= 0:
+        if node.next is None:
+            node.next = [None] * _WIDTH
+        node.next[idx] = child
+    else:
+        if node.extra is None:
+            node.extra = {}
+        node.extra[b] = child
+
+
+def _del_child(node: _Node, b: int):
+    """Detach the child of node whose label starts with byte b."""
+    idx = _IDX[b]
+    if idx >= 0:
+        node.next[idx] = None
+        if not any(node.next):
+            node.next = None
+    else:
+        del node.extra[b]
+
+
+def _children(node: _Node):
+    """Yield child nodes; charset children come out alphabetically."""
+    if node.next is not None:
+        for nxt in node.next:
+            if nxt is not None:
+                yield nxt
+    if node.extra:
+        yield from node.extra.values()
+
+
+def _has_children(node: _Node) -> bool:
+    return (node.next is not None and any(node.next)) or bool(node.extra)
+
+
+def _refresh(path):
+    """Recompute max_sub bottom-up along a root-to-node path."""
+    for depth in range(len(path) - 1, -1, -1):
+        node = path[depth]
+        best = node.score if node.end else _NO_SCORE
+        for nxt in _children(node):
+            if nxt.max_sub > best:
+                best = nxt.max_sub
+        if best == node.max_sub and depth < len(path) - 1:
+            break  # an unchanged ancestor means the rest is consistent
+        node.max_sub = best
+
+
+def _only_child(node: _Node):
+    """Return the single child of node, or None if it has zero or several."""
+    found = None
+    for nxt in _children(node):
+        if found is not None:
+            return None
+        found = nxt
+    return found
+
+
+def _drain(heap):
+    """Pop a (score, inverted key) min-heap into a best-first list of words."""
+    out = []
+    pop = heapq.heappop
+    while heap:
+        key = pop(heap)[1]
+        out.append(key[:-1].translate(_INVERT).decode("utf-8"))
+    out.reverse()
+    return out
+
+
+def _fill_heap(node: _Node, buf: bytearray, k: int, heap: list, stack: list):
+    """
+    Collect the k best words below node into heap, a (score, inverted key)
+    min-heap. heap and stack are caller-owned scratch lists, emptied first.
+
+    The walk runs in two phases: until k words are found nothing can be
+    pruned or displaced, so the fill loop skips those checks entirely;
+    afterwards heap[0] bounds both the max_sub pruning and the pushpop.
+    Keys are built from the path bytes and only decoded by _drain().
+    """
+    heap.clear()
+    stack.clear()
+    push, pushpop = heapq.heappush, heapq.heappushpop
+    pop, append = stack.pop, stack.append
+    append((node, len(buf)))
+
+    while stack and len(heap) < k:
+        n, mark = pop()
+        del buf[mark:]
+        buf += n.label
+        if n.end:
+            key = buf.translate(_INVERT)
+            key.append(0xFF)
+            push(heap, (n.score, key))
+        depth = len(buf)
+        if n.extra:
+            for nxt in reversed(n.extra.values()):
+                append((nxt, depth))
+        if n.next is not None:
+            for nxt in reversed(n.next):
+                if nxt is not None:
+                    append((nxt, depth))
+
+    while stack:
+        n, mark = pop()
+        if n.max_sub < heap[0][0]:
+            continue
+        del buf[mark:]
+        buf += n.label
+        if n.end and n.score >= heap[0][0]:
+            key = buf.translate(_INVERT)
+            key.append(0xFF)
+            pushpop(heap, (n.score, key))
+        depth = len(buf)
+        if n.extra:
+            for nxt in reversed(n.extra.values()):
+                append((nxt, depth))
+        if n.next is not None:
+            for nxt in reversed(n.next):
+                if nxt is not None:
+                    append((nxt, depth))
+
+
+def _best_one(node: _Node, buf: bytearray, stack: list):
+    """complete(prefix, 1): track a single best word instead of a heap."""
+    best_score, best = _NO_SCORE, None
+    stack.clear()
+    pop, append = stack.pop, stack.append
+    append((node, len(buf)))
+    while stack:
+        n, mark = pop()
+        if n.max_sub < best_score:
+            continue
+        del buf[mark:]
+        buf += n.label
+        if n.end:
+            score = n.score
+            # UTF-8 bytes compare in code point order, like the decoded str
+            if best is None or score > best_score or (score == best_score and buf < best):
+                best_score, best = score, bytes(buf)
+        depth = len(buf)
+        if n.extra:
+            for nxt in reversed(n.extra.values()):
+                append((nxt, depth))
+        if n.next is not None:
+            for nxt in reversed(n.next):
+                if nxt is not None:
+                    append((nxt, depth))
+    return [] if best is None else [best.decode("utf-8")]
+
+
+def _write_replace(path, data):
+    """
+    Write data to a temp file beside path, then rename it over path.
+
+    Truncating path in place would pull the pages out from under any
+    MappedTrie still mapping it (SIGBUS on the next read); the rename
+    leaves that mapping on the old file.
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)  # mkstemp creates files as 0600
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 class Trie:
@@ -31,45 +262,136 @@ class Trie:
         self.root = _Node()
         self._count_words = 0
         self._count_nodes = 1  # root itself
+        self._height = 0  # longest word; recomputed lazily after removals
+        self._height_dirty = False
+        self._gen = 0  # bumped on every change; stale cache keys never match
+        self._cache = OrderedDict()  # (gen, prefix, k) → tuple of words
+        # scratch space reused by every complete() call instead of reallocated
+        self._heap = []
+        self._stack = []
+        self._path = bytearray()
 
     # ---------- internal helpers ----------
 
     def _trace(self, text: str):
-        """Follow a path down the trie for a given text. Return (node, path)."""
+        """
+        Follow a path down the trie for a given text. Return (node, path).
+
+        The text must end exactly on a node boundary; path lists every node
+        visited from the root down to (and including) that node.
+        """
+        text = text.encode("utf-8")
         node = self.root
-        path = [(node, '')]
-        for ch in text:
-            nxt = node.next.get(ch)
-            if nxt is None:
+        path = [node]
+        i, n = 0, len(text)
+        while i < n:
+            nxt = _child(node, text[i])
+            if nxt is None or not text.startswith(nxt.label, i):
                 return None, []
             node = nxt
-            path.append((node, ch))
+            i += len(nxt.label)
+            path.append(node)
         return node, path
 
+    def _locate(self, prefix: str):
+        """
+        Find the top node of the subtree holding every word that starts with
+        prefix. Return (node, text) where text is the UTF-8 path to node; it
+        may run past prefix when prefix ends in the middle of an edge.
+        """
+        prefix = prefix.encode("utf-8")
+        node = self.root
+        i, n = 0, len(prefix)
+        while i < n:
+            nxt = _child(node, prefix[i])
+            if nxt is None:
+                return None, b""
+            label = nxt.label
+            if prefix.startswith(label, i):
+                node = nxt
+                i += len(label)
+            elif label.startswith(prefix[i:]):
+                return nxt, prefix[:i] + label
+            else:
+                return None, b""
+        return node, prefix
+
+    def _merge(self, node: _Node, child: _Node):
+        """Absorb node's only child into node, joining the two edge labels."""
+        node.label += child.label
+        node.next = child.next
+        node.extra = child.extra
+        node.end = child.end
+        node.score = child.score
+        node.max_sub = child.max_sub
+        self._count_nodes -= 1
+
     # ---------- core API ----------
 
     def insert(self, word: str, freq: float):
         """
         Insert a word with its frequency (updating if it already exists).
 
+        An edge that only partially matches is split in two. Every node on
+        the path raises its max_sub to freq on the way down.
         Complexity: O(L) where L = len(word)
         """
+        self._gen += 1
+        data = word.encode("utf-8")
         node = self.root
-        for ch in word:
-            if ch not in node.next:
-                node.next[ch] = _Node()
+        path = [node]
+        i, n = 0, len(data)
+        while i < n:
+            if freq > node.max_sub:
+                node.max_sub = freq
+            child = _child(node, data[i])
+            if child is None:
+                child = _Node(data[i:])
+                _set_child(node, child)
                 self._count_nodes += 1
-            node = node.next[ch]
+                node = child
+                path.append(node)
+                break
 
+            label = child.label
+            if data.startswith(label, i):
+                i += len(label)
+                node = child
+                path.append(node)
+                continue
+
+            # split the edge at the first mismatch (first byte always matches)
+            j, m = 1, len(label)
+            while j < m and i + j < n and data[i + j] == label[j]:
+                j += 1
+            mid = _Node(label[:j])
+            mid.max_sub = child.max_sub
+            child.label = label[j:]
+            _set_child(mid, child)
+            _set_child(node, mid)
+            self._count_nodes += 1
+            node = mid
+            path.append(node)
+            i += j
+
+        lowered = node.end and freq < node.score
         if not node.end:
             self._count_words += 1
+            if len(word) > self._height:
+                self._height = len(word)
         node.end = True
         node.score = freq
+        if lowered:
+            # an update to a lower score may shrink max_sub along the path
+            _refresh(path)
+        elif freq > node.max_sub:
+            node.max_sub = freq
 
     def remove(self, word: str) -> bool:
         """
         Remove a word from the trie if present. Returns True if removed.
 
+        Nodes left with a single child and no word are merged back into it.
         Complexity: O(L)
         """
         node, path = self._trace(word)
@@ -79,25 +401,122 @@ class Trie:
         node.end = False
         node.score = 0.0
         self._count_words -= 1
+        self._gen += 1
+        if len(word) == self._height:
+            self._height_dirty = True
+
+        if node is self.root:
+            _refresh(path)
+            return True
+
+        parent = path[-2]
+        if not _has_children(node):
+            # leaf: detach it, then the parent may be left as a bare link
+            _del_child(parent, node.label[0])
+            self._count_nodes -= 1
+            path.pop()
+            if parent is not self.root and not parent.end:
+                only = _only_child(parent)
+                if only is not None:
+                    self._merge(parent, only)
+        else:
+            only = _only_child(node)
+            if only is not None:
+                self._merge(node, only)
+
+        _refresh(path)
+        return True
 
-        # prune unused nodes
-        # Note: path[i] is (current_node, incoming_char_for_current)
-        #       path[i-1] is (parent_node, incoming_char_for_parent)
-        for i in range(len(path) - 1, 0, -1):
-            parent_node, _ = path[i - 1]
-            current_node, current_char = path[i]
-            # If current node still used (has children or marks another word), stop.
-            if current_node.next or current_node.end:
-                break
-            # delete the key in parent that points to current
-            if current_char in parent_node.next:
-                del parent_node.next[current_char]
-                self._count_nodes -= 1
+    def bulk_insert(self, pairs):
+        """
+        Insert many (word, freq) pairs at once.
+
+        On an empty trie the pairs are sorted by word and the trie is built
+        in a single pass: a stack mirrors the path to the previous word, so
+        each word only descends below its common prefix with that word.
+        Later duplicates win, as with repeated insert() calls.
+
+        The per-word work avoids Python-level loops over characters: the
+        common prefix comes from one XOR of the two words read as big
+        integers, and leaves go straight into their parent's slot list.
+
+        Complexity: O(N log N + total length)
+        """
+        if self.root.end or _has_children(self.root):
+            for word, freq in pairs:
+                self.insert(word, freq)
+            return
+
+        self._gen += 1
+        stack = [(self.root, 0)]  # (node, byte depth at the end of its label)
+        pop, append = stack.pop, stack.append
+        words = nodes = longest = 0
+        prev = b""
+        from_bytes, idx_of, new_node = int.from_bytes, _IDX, _Node
+        # UTF-8 byte order matches code point order, so sorting the str
+        # keys also sorts the encoded words
+        for text, freq in sorted(pairs, key=itemgetter(0)):
+            word = text.encode("utf-8")
+            n = len(word)
+            m = len(prev) if len(prev) < n else n
+            # bytes after the common prefix leave set bits in the XOR
+            diff = from_bytes(prev[:m], "big") ^ from_bytes(word[:m], "big")
+            k = m - ((diff.bit_length() + 7) >> 3)
+
+            # close off nodes below the common prefix; their subtrees are final
+            last = None
+            while stack[-1][1] > k:
+                last = pop()[0]
+                top = stack[-1][0]
+                if last.max_sub > top.max_sub:
+                    top.max_sub = last.max_sub
+            top, depth = stack[-1]
+
+            if depth < k:
+                # the common prefix ends inside last's label: split it
+                cut = k - depth
+                mid = _Node(last.label[:cut])
+                mid.max_sub = last.max_sub
+                last.label = last.label[cut:]
+                _set_child(mid, last)
+                _set_child(top, mid)
+                nodes += 1
+                append((mid, k))
+                top = mid
+
+            if k < n:
+                node = new_node(word[k:])
+                idx = idx_of[word[k]]
+                if idx >= 0:
+                    slots = top.next
+                    if slots is None:
+                        slots = top.next = [None] * _WIDTH
+                    slots[idx] = node
+                else:
+                    _set_child(top, node)
+                nodes += 1
+                append((node, n))
+                if len(text) > longest:
+                    longest = len(text)
             else:
-                # Defensive: if the mapping is absent, stop pruning
-                break
+                node = top  # repeat of prev (or the empty word)
 
-        return True
+            if not node.end:
+                words += 1
+            node.end = True
+            node.score = freq
+            node.max_sub = freq  # no children have been closed off yet
+            prev = word
+
+        while len(stack) > 1:
+            last = pop()[0]
+            top = stack[-1][0]
+            if last.max_sub > top.max_sub:
+                top.max_sub = last.max_sub
+
+        self._count_words += words
+        self._count_nodes += nodes
+        self._height = longest
 
     def contains(self, word: str) -> bool:
         """Check whether an exact word exists."""
@@ -112,45 +531,59 @@ class Trie:
           - Highest frequency first
           - Alphabetical order for ties
 
-        Complexity: O(M + N log K)
-        """
-        node, _ = self._trace(prefix)
-        if not node:
-            return []
+        Subtrees whose max_sub cannot beat the current k-th best score are
+        skipped once the heap is full.
 
-        heap = []  # (freq, word)
+        Results are cached per (prefix, k) until the next insert/remove, so
+        repeated queries while typing cost one dict lookup.
 
-        def dfs(n: _Node, word: str):
-            if n.end:
-                pair = (n.score, word)
-                if len(heap) < k:
-                    heapq.heappush(heap, pair)
-                else:
-                    heapq.heappushpop(heap, pair)
-
-            for c in sorted(n.next.keys()):
-                dfs(n.next[c], word + c)
+        Complexity: O(M + N log K), M = nodes actually visited
+        """
+        cache = self._cache
+        key = (self._gen, prefix, k)
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+            return list(hit)
+
+        words = self._topk(prefix, k)
+        cache[key] = tuple(words)
+        if len(cache) > _CACHE_SIZE:
+            cache.popitem(last=False)
+        return words
+
+    def _topk(self, prefix: str, k: int):
+        """Uncached body of complete(); k == 1 takes a heap-free scan."""
+        node, text = self._locate(prefix)
+        if not node or k <= 0:
+            return []
 
-        dfs(node, prefix)
+        # buf[:mark] spells the path above a stacked node
+        buf = self._path
+        buf[:] = text[:len(text) - len(node.label)]
+        if k == 1:
+            return _best_one(node, buf, self._stack)
 
-        # sort by freq desc, word asc
-        results = sorted(heap, key=lambda x: (-x[0], x[1]))
-        return [w for _, w in results]
+        # popping the min-heap yields worst first; _drain reverses it into
+        # freq desc, word asc without a separate sort
+        heap = self._heap
+        _fill_heap(node, buf, k, heap, self._stack)
+        return _drain(heap)
 
     def stats(self):
         """
         Return (word_count, height, node_count).
 
-        Height = length of the longest path from root to leaf.
-        Complexity: O(T)
+        Height = length in characters of the longest path from root to leaf,
+        i.e. the length of the longest word.
+        Complexity: O(1), or O(T) once after removing a longest word
         """
+        if self._height_dirty:
+            # labels are bytes, so measure the decoded words
+            self._height = max((len(w) for w, _ in self.items()), default=0)
+            self._height_dirty = False
 
-        def depth(n: _Node):
-            if not n.next:
-                return 0
-            return 1 + max(depth(child) for child in n.next.values())
-
-        return self._count_words, depth(self.root), self._count_nodes
+        return self._count_words, self._height, self._count_nodes
 
     def items(self):
         """
@@ -159,12 +592,194 @@ class Trie:
         Complexity: O(T)
         """
         output = []
-
-        def gather(n: _Node, text: str):
+        buf = bytearray()  # path to the current node, decoded only at word ends
+        stack = [(self.root, 0)]
+        pop, append = stack.pop, stack.append
+        while stack:
+            n, mark = pop()
+            del buf[mark:]
+            buf += n.label
             if n.end:
-                output.append((text, n.score))
-            for c, nxt in n.next.items():
-                gather(nxt, text + c)
+                output.append((buf.decode("utf-8"), n.score))
+
+            depth = len(buf)
+            if n.extra:
+                for nxt in reversed(n.extra.values()):
+                    append((nxt, depth))
+            if n.next is not None:
+                for nxt in reversed(n.next):
+                    if nxt is not None:
+                        append((nxt, depth))
+        return output
+
+    def save_bin(self, path):
+        """
+        Write the trie to path in the flat binary layout read by load_bin().
+
+        Complexity: O(T)
+        """
+        order = [self.root]
+        kids = []
+        labels = []
+        for n in order:  # grows while iterating: breadth-first
+            children = sorted(_children(n), key=lambda c: c.label)
+            kids.append(children)
+            labels.append(n.label)
+            order.extend(children)
+
+        offsets = []
+        off = _HEADER.size
+        for label, children in zip(labels, kids):
+            offsets.append(off)
+            off += _RECORD.size + len(label) + _EDGE.size * len(children)
+
+        words, height, nodes = self.stats()
+        buf = bytearray(_HEADER.pack(_MAGIC, off, words, nodes, height))
+        child_at = 1  # BFS index of the first child of the current node
+        for n, label, children in zip(order, labels, kids):
+            buf += _RECORD.pack(n.end, n.score, n.max_sub, len(label), len(children))
+            buf += label
+            for c in children:
+                buf += _EDGE.pack(c.label[0], offsets[child_at])
+                child_at += 1
+
+        _write_replace(path, buf)
+
+    @staticmethod
+    def load_bin(path):
+        """
+        Map a file written by save_bin() and return a read-only MappedTrie.
+
+        No nodes are built: startup cost is O(1) regardless of trie size.
+        """
+        return MappedTrie(path)
+
+
+class MappedTrie:
+    """Read-only trie answering queries straight from a save_bin() file."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._buf) < _HEADER.size:
+            self._buf.close()
+            raise ValueError(f"{path} is too short to be a binary trie file")
+        magic, size, self._words, self._nodes, self._height = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            self._buf.close()
+            raise ValueError(f"{path} is not a binary trie file")
+        if size != len(self._buf):
+            # a cut-off body would only fail later, inside a query
+            self._buf.close()
+            raise ValueError(f"{path} is truncated or has trailing data")
+
+    # ---------- internal helpers ----------
+
+    def _read(self, off: int):
+        """Decode the node at off. Return (end, score, max_sub, label, edges_at, n)."""
+        end, score, max_sub, size, n = _RECORD.unpack_from(self._buf, off)
+        start = off + _RECORD.size
+        return end, score, max_sub, self._buf[start:start + size], start + size, n
+
+    def _edges(self, at: int, n: int):
+        """Return the child offsets of a node, in byte order."""
+        buf = self._buf
+        return [_EDGE.unpack_from(buf, at + i * _EDGE.size)[1] for i in range(n)]
+
+    def _child(self, at: int, n: int, b: int):
+        """Return the offset of the child whose label starts with byte b, or None."""
+        for i in range(n):
+            first, child = _EDGE.unpack_from(self._buf, at + i * _EDGE.size)
+            if first == b:
+                return child
+        return None
+
+    def _locate(self, prefix: str):
+        """Same contract as Trie._locate, over node offsets."""
+        prefix = prefix.encode("utf-8")
+        off = _HEADER.size
+        i, n = 0, len(prefix)
+        while i < n:
+            _, _, _, _, at, count = self._read(off)
+            nxt = self._child(at, count, prefix[i])
+            if nxt is None:
+                return None, b""
+            label = self._read(nxt)[3]
+            if prefix.startswith(label, i):
+                off = nxt
+                i += len(label)
+            elif label.startswith(prefix[i:]):
+                return nxt, prefix[:i] + label
+            else:
+                return None, b""
+        return off, prefix
+
+    # ---------- core API ----------
 
-        gather(self.root, "")
+    def contains(self, word: str) -> bool:
+        """Check whether an exact word exists."""
+        off, text = self._locate(word)
+        return (off is not None and text == word.encode("utf-8")
+                and bool(self._read(off)[0]))
+
+    def complete(self, prefix: str, k: int):
+        """Return up to k best completions, ranked exactly like Trie.complete."""
+        off, text = self._locate(prefix)
+        if off is None or k <= 0:
+            return []
+
+        heap = []  # (freq, inverted key), as in _fill_heap
+        push, pushpop = heapq.heappush, heapq.heappushpop
+        label = self._read(off)[3]
+        buf = bytearray(text[:len(text) - len(label)])
+        stack = [(off, len(buf))]
+        while stack:
+            off, mark = stack.pop()
+            end, score, max_sub, label, at, count = self._read(off)
+            if len(heap) == k and max_sub < heap[0][0]:
+                continue
+            del buf[mark:]
+            buf += label
+
+            if end and (len(heap) < k or score >= heap[0][0]):
+                key = buf.translate(_INVERT)
+                key.append(0xFF)
+                if len(heap) < k:
+                    push(heap, (score, key))
+                else:
+                    pushpop(heap, (score, key))
+
+            depth = len(buf)
+            stack.extend([(c, depth) for c in reversed(self._edges(at, count))])
+
+        return _drain(heap)
+
+    def stats(self):
+        """Return (word_count, height, node_count) as recorded in the header."""
+        return self._words, self._height, self._nodes
+
+    def items(self):
+        """Return all (word, freq) pairs stored in the file."""
+        output = []
+        buf = bytearray()
+        stack = [(_HEADER.size, 0)]
+        while stack:
+            off, mark = stack.pop()
+            end, score, _, label, at, count = self._read(off)
+            del buf[mark:]
+            buf += label
+            if end:
+                output.append((buf.decode("utf-8"), score))
+            depth = len(buf)
+            stack.extend([(c, depth) for c in reversed(self._edges(at, count))])
         return output
+
+    def save_bin(self, path):
+        """Copy the mapped file to path."""
+        _write_replace(path, self._buf)
+
+    def thaw(self) -> Trie:
+        """Build an editable Trie holding the same words."""
+        trie = Trie()
+        trie.bulk_insert(self.items())
+        return trie
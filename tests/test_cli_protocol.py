@@ -37,4 +37,66 @@ quit
     out = run_cli(cmds)
     # First line is OK/MISS depending on presence of 'zebra'
     assert out[0] in ("OK", "MISS")
-    assert out[1].startswith('words=') and 'height=' in out[1] and 'nodes=' in out[1]
\ No newline at end of file
+    assert out[1].startswith('words=') and 'height=' in out[1] and 'nodes=' in out[1]
+
+def test_cli_binary_save_and_load(tmp_path):
+    snap = tmp_path / 'small.trie'
+    cmds = f"""
+load {RES}
+save {snap}
+load {snap}
+complete he 3
+insert hex 9
+complete he 2
+quit
+"""
+    out = run_cli(cmds)
+    assert out == ['hello,help,hell', 'hex,hello']
+
+def test_cli_save_over_loaded_binary(tmp_path):
+    snap = tmp_path / 'small.trie'
+    cmds = f"""
+load {RES}
+save {snap}
+load {snap}
+save {snap}
+complete he 3
+load {snap}
+complete he 3
+quit
+"""
+    out = run_cli(cmds)
+    assert out == ['hello,help,hell', 'hello,help,hell']
+
+
+def test_cli_load_truncated_binary_is_ignored(tmp_path):
+    snap = tmp_path / 'small.trie'
+    short = tmp_path / 'short.trie'
+    cut = tmp_path / 'cut.trie'
+    run_cli(f"load {RES}\nsave {snap}\nquit\n")
+    short.write_bytes(snap.read_bytes()[:2])
+    cut.write_bytes(snap.read_bytes()[:40])  # whole header, cut-off body
+    cmds = f"""
+load {RES}
+load {short}
+complete he 3
+load {cut}
+complete he 3
+contains hello
+quit
+"""
+    p = subprocess.run([PYTHON, str(APP)], input=cmds, capture_output=True, text=True)
+    assert p.returncode == 0
+    assert p.stdout.strip().splitlines() == ['hello,help,hell', 'hello,help,hell', 'YES']
+
+
+def test_cli_commands_split_across_reads(monkeypatch, capsys):
+    import io
+    from src import app
+    cmds = f"load {RES}\r\ninsert hex 9\r\ncomplete he 2\r\ncontains hex\r\nstats"
+    monkeypatch.setattr(app, 'READ_CHUNK', 5)  # every command spans several reads
+    monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(cmds.encode())))
+    app.main()
+    out = capsys.readouterr().out.splitlines()
+    assert out[:2] == ['hex,hello', 'YES']
+    assert len(out) == 3 and out[2].startswith('words=')
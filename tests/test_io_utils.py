@@ -0,0 +1,55 @@
+# tests/test_io_utils.py
+import csv
+import io
+from decimal import Decimal
+from src.io_utils import load_csv, save_csv
+
+
+def test_load_csv_word_only_column(tmp_path):
+    path = tmp_path / 'words.csv'
+    path.write_text('a\nB\n', encoding='utf-8')
+    assert load_csv(path) == [('a', 0.0), ('b', 0.0)]
+
+
+def test_load_csv_edge_cases(tmp_path):
+    path = tmp_path / 'words.csv'
+    path.write_text('a,1\nb\n\nc,2,x\nd,oops\n', encoding='utf-8')
+    assert load_csv(path) == [('a', 1.0), ('b', 0.0), ('c', 2.0), ('d', 0.0)]
+
+
+def test_load_csv_keeps_csv_reader_semantics(tmp_path):
+    path = tmp_path / 'words.csv'
+    path.write_bytes('\ufeffa,1_000\n  \nb,inf\n\r,c\n'.encode('utf-8'))
+    assert load_csv(path) == [('\ufeffa', 1000.0), ('', 0.0), ('b', float('inf')), ('', 0.0)]
+
+
+def test_load_csv_integer_scores_are_floats(tmp_path):
+    path = tmp_path / 'words.csv'
+    path.write_text('a,1\nb,2\n', encoding='utf-8')
+    pairs = load_csv(path)
+    assert pairs == [('a', 1.0), ('b', 2.0)]
+    assert all(type(s) is float for _, s in pairs)
+
+
+def test_save_csv_load_csv_round_trip(tmp_path):
+    path = tmp_path / 'words.csv'
+    pairs = [('plain', 1.5), ('with,comma', 2.0), ('say "hi"', 3.0), ('two\nlines', 4.0)]
+    save_csv(path, pairs)
+    with path.open('a', encoding='utf-8', newline='') as f:
+        f.write('\r\n\nextra,5,x,y\r\nbad,nope\r\nquoted,"6.5"\n')
+    assert load_csv(path) == pairs + [('extra', 5.0), ('bad', 0.0), ('quoted', 6.5)]
+
+
+def test_load_csv_bare_cr_line_endings(tmp_path):
+    path = tmp_path / 'words.csv'
+    path.write_bytes(b'a,1\rb,2\r')
+    assert load_csv(path) == [('a', 1.0), ('b', 2.0)]
+
+
+def test_save_csv_matches_csv_writer(tmp_path):
+    pairs = [('a', 1.5), ('b', 2), ('c', '0.25'), ('d', Decimal('1.10')), ('e', 1e-7)]
+    for rows in (pairs, pairs + [('needs,quotes', 3.0)]):  # fast path, then csv fallback
+        expected = io.StringIO(newline='')
+        csv.writer(expected).writerows(rows)
+        save_csv(tmp_path / 'out.csv', rows)
+        assert (tmp_path / 'out.csv').read_bytes() == expected.getvalue().encode('utf-8')
@@ -1,5 +1,5 @@
 # tests/test_trie_basic.py
-from src.trie import Trie
+from src.trie import Trie, _children
 from pathlib import Path
 from src.io_utils import load_csv
 
@@ -81,4 +81,136 @@ def test_update_frequency_affects_ranking():
     t.insert('hello', 1)
     t.insert('helium', 10)
     out = t.complete('he', 2)
-    assert out == ['helium', 'hello']
\ No newline at end of file
+    assert out == ['helium', 'hello']
+
+def test_remove_merges_split_edge():
+    t = Trie()
+    t.insert('team', 1)
+    t.insert('test', 2)
+    assert t.stats() == (2, 4, 4)  # root, 'te', 'am', 'st'
+    assert t.remove('team') is True
+    assert t.stats() == (1, 4, 2)
+    assert t.complete('tes', 5) == ['test']
+
+
+def _check_max_sub(node):
+    """Assert every max_sub equals the best score in its subtree; return it."""
+    best = node.score if node.end else float('-inf')
+    for child in _children(node):
+        best = max(best, _check_max_sub(child))
+    assert node.max_sub == best, node.label
+    return best
+
+
+def test_lowered_and_removed_scores_do_not_prune_results():
+    t = Trie()
+    t.insert('ab', 10)
+    t.insert('ac', 5)
+    t.insert('ab', 1)  # max_sub above 'ab' must drop from 10 to 5
+    _check_max_sub(t.root)
+    assert t.complete('a', 1) == ['ac']
+
+    t = Trie()
+    for w, s in (('ma', 6), ('zb', 10), ('zc', 5), ('zd', 4)):
+        t.insert(w, s)
+    t.insert('zb', 1)
+    _check_max_sub(t.root)
+    # 'ma' and 'zb' fill the heap, so a stale 'z' subtree would be pruned
+    assert t.complete('', 2) == ['ma', 'zc']
+    assert t.remove('zc') is True
+    _check_max_sub(t.root)
+    assert t.complete('', 2) == ['ma', 'zd']
+    assert t.remove('zd') is True  # 'z' merges into the 'zb' edge
+    _check_max_sub(t.root)
+    assert t.complete('', 2) == ['ma', 'zb']
+    assert t.remove('ma') is True  # removes the top-scoring word
+    _check_max_sub(t.root)
+    assert t.complete('', 1) == ['zb']
+
+    t = Trie()
+    for w, s in (('qab', 10), ('qac', 2), ('qd', 3)):
+        t.insert(w, s)
+    assert t.remove('qab') is True  # 'a' merges into 'ac', whose max_sub is already 2
+    _check_max_sub(t.root)
+    assert t.complete('q', 1) == ['qd']
+
+
+def test_height_after_removing_longest_word():
+    t = Trie()
+    t.insert('a', 1)
+    t.insert('abcd', 2)
+    assert t.stats()[1] == 4
+    assert t.remove('abcd') is True
+    assert t.stats()[1] == 1
+    assert t.remove('a') is True
+    assert t.stats()[1] == 0
+
+
+def test_height_after_bulk_insert():
+    t = Trie()
+    t.bulk_insert([('a', 1), ('héllo', 2), ('abcd', 3)])
+    assert t.stats()[1] == 5  # characters, not UTF-8 bytes
+    t.bulk_insert([('abcdefg', 1)])
+    assert t.stats()[1] == 7
+    t.remove('abcdefg')
+    assert t.stats()[1] == 5
+
+
+def test_bulk_insert_matches_insert():
+    pairs = load_csv(RES) + [('help', 9.0)]  # later duplicate wins
+    one, bulk = Trie(), Trie()
+    for w, s in pairs:
+        one.insert(w, s)
+    bulk.bulk_insert(pairs)
+    assert sorted(bulk.items()) == sorted(one.items())
+    assert bulk.stats() == one.stats()
+    assert bulk.complete('he', 3) == ['help', 'hello', 'hell']
+
+
+def test_save_bin_round_trip(tmp_path):
+    t = Trie()
+    t.bulk_insert(load_csv(RES))
+    t.save_bin(tmp_path / 'small.trie')
+    m = Trie.load_bin(tmp_path / 'small.trie')
+    assert m.stats() == t.stats()
+    assert sorted(m.items()) == sorted(t.items())
+    assert m.complete('he', 3) == ['hello', 'help', 'hell']
+    assert m.contains('zen') and not m.contains('ze')
+
+
+def test_cached_complete_sees_updates():
+    t = Trie()
+    t.insert('hello', 1)
+    out = t.complete('he', 2)
+    out.append('junk')  # callers get a copy, never the cached entry
+    assert t.complete('he', 2) == ['hello']
+    t.insert('help', 5)
+    assert t.complete('he', 2) == ['help', 'hello']
+    t.remove('help')
+    assert t.complete('he', 2) == ['hello']
+
+
+def test_tie_break_keeps_alphabetical_first_when_truncating():
+    t = Trie()
+    for w in ('ad', 'ac', 'ab', 'aa'):
+        t.insert(w, 1.0)
+    assert t.complete('a', 2) == ['aa', 'ab']
+
+
+def test_tie_break_keeps_alphabetical_first_for_k_one():
+    t = Trie()
+    for w in ('ad', 'ac', 'ab', 'aa'):
+        t.insert(w, 1.0)
+    t.insert('a', 0.5)
+    assert t.complete('a', 1) == ['aa']
+    assert t.complete('ac', 1) == ['ac']
+
+
+def test_tie_break_with_nul_suffix(tmp_path):
+    t = Trie()
+    t.insert('a', 1)
+    t.insert('a\x00', 1)
+    assert t.complete('', 2) == ['a', 'a\x00']
+    assert t.complete('', 1) == ['a']
+    t.save_bin(tmp_path / 'nul.trie')
+    assert Trie.load_bin(tmp_path / 'nul.trie').complete('', 2) == ['a', 'a\x00']